@@ -1,16 +1,61 @@
 import eel
-import pandas as pd
-import json
+import bisect
+import logging
+import math
+import os
+import queue
+import selectors
 import socket
+import struct
+import subprocess
+import sys
+import tempfile
 import threading
+import time
+
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from models import initialize_database, schema_is_current
 
 # --- Configuration ---
+# Deferred %-formatting everywhere below: suppressed levels (e.g. the
+# per-event debug lines) skip string building entirely.
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+logger = logging.getLogger(__name__)
+
 eel.init('web')
 
+
+class _OrjsonShim:
+    """Drop-in for the json module that Eel uses to serialize payloads.
+
+    orjson serializes the float-heavy overview/dashboard dicts several
+    times faster than the stdlib encoder.
+    """
+
+    # OPT_SERIALIZE_NUMPY lets ndarray-backed payloads (e.g. vectorized
+    # collector output) serialize without a .tolist() boxing pass first.
+    _OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    @staticmethod
+    def dumps(obj, **_kwargs):
+        return orjson.dumps(obj, option=_OrjsonShim._OPTS).decode()
+
+    @staticmethod
+    def loads(data, **_kwargs):
+        return orjson.loads(data)
+
+
+# Eel imports the json module as `jsn`; swap it for the orjson shim so every
+# @eel.expose return value and eel.* call serializes through orjson.
+for _attr in ("jsn", "json"):
+    if hasattr(eel, _attr):
+        setattr(eel, _attr, _OrjsonShim)
+        break
+
 DEFAULT_SETTINGS = {
     "refresh_interval": 180,
     "theme": "dark",
@@ -34,6 +79,27 @@ SENSITIVITY_MAP = {
     "DEFAULT": 0.0025
 }
 
+# Compass quadrant text, indexed by (pos_gamma << 1) | bull_trend so the
+# overview path does a tuple lookup instead of rebuilding branch strings.
+_COMPASS_QUADRANTS = (
+    # negative gamma, bearish trend
+    ("CRASH / FLUSH",
+     "Negative gamma below flip. Watch for downside range expansion; momentum can persist.",
+     "🔴"),
+    # negative gamma, bullish trend
+    ("MELT UP",
+     "Negative gamma with spot above flip. Favor momentum and upside range expansion; avoid early fades.",
+     "🟡"),
+    # positive gamma, bearish trend
+    ("SUPPORT / CHOP",
+     "Positive gamma below flip. Favor range discipline and mean-reversion; watch for failed breakdowns.",
+     "⚪"),
+    # positive gamma, bullish trend
+    ("GRIND UP",
+     "Positive gamma with spot above flip. Favor controlled upside and mean-reversion on pullbacks.",
+     "🟢"),
+)
+
 def calculate_0dte_trend_score(spot, flip, symbol):
     """
     Calculates a score between -1 and 1 based on distance from flip.
@@ -67,20 +133,19 @@ def parse_timestamp(value):
             return None
     return None
 
-def estimate_flip_from_profile(profile_data, spot=0):
+def estimate_flip_from_profile(profile_strikes, profile_gex, spot=0):
     """
     Estimate a usable flip reference from the current signed GEX profile.
 
-    The high-confidence case is an interpolated zero crossing of cumulative
+    Takes parallel strike/GEX sequences (one entry per contract row). The
+    high-confidence case is an interpolated zero crossing of cumulative
     signed GEX. If there is no crossing in the collected strike range, return a
     lower-confidence proxy from the strongest opposite-sign strike cluster.
     """
     strikes_gex = {}
-    for row in profile_data or []:
-        strike = row.get('strike_price')
-        gex = row.get('gex_value', 0) or 0
+    for strike, gex in zip(profile_strikes or [], profile_gex or []):
         if strike is not None:
-            strikes_gex[strike] = strikes_gex.get(strike, 0) + gex
+            strikes_gex[strike] = strikes_gex.get(strike, 0) + (gex or 0)
 
     strikes = sorted(strikes_gex.keys())
     if not strikes:
@@ -155,8 +220,6 @@ def estimate_flip_from_profile(profile_data, spot=0):
     }
 
 def calculate_gex_imbalance_score(net_gex, call_gex, put_gex):
-    import math
-
     gross_gex = abs(call_gex or 0) + abs(put_gex or 0)
     if gross_gex == 0:
         return 0, 0
@@ -207,27 +270,26 @@ def calculate_component_confidence(row, profile_count, flip_state, gross_gex):
         "age_seconds": age_seconds
     }
 
-def calculate_gex_slope(spot, profile_data):
+def calculate_gex_slope(spot, profile_strikes, profile_gex):
     """
     Calculates the GEX Gradient (Slope) at the current spot price.
+    Takes parallel strike/GEX sequences (one entry per contract row).
     Tells us how fast hedging requirements change as price moves.
     """
-    if not profile_data or spot == 0:
+    if not profile_strikes or spot == 0:
         return 0
 
     # 1. Aggregate GEX by strike
     strikes_gex = {}
-    for row in profile_data:
-        s = row.get('strike_price')
+    for s, g in zip(profile_strikes, profile_gex):
         if s is not None:
-            strikes_gex[s] = strikes_gex.get(s, 0) + row.get('gex_value', 0)
+            strikes_gex[s] = strikes_gex.get(s, 0) + (g or 0)
 
     sorted_strikes = sorted(strikes_gex.keys())
     if len(sorted_strikes) < 2:
         return 0
 
     # 2. Find strikes surrounding spot
-    import bisect
     idx = bisect.bisect_left(sorted_strikes, spot)
 
     # Get two nearest strikes
@@ -243,80 +305,311 @@ def calculate_gex_slope(spot, profile_data):
     # Slope = Rate of change of GEX per dollar
     return (g2 - g1) / (s2 - s1) if s2 != s1 else 0
 
+# --- NinjaTrader Broadcast Queue ---
+# Broadcasts run on a dedicated daemon thread so neither the Eel request
+# path nor the event server blocks on NinjaTrader socket I/O. The queue is
+# bounded and drops when full to preserve liveness if NinjaTrader stalls.
+_NT_QUEUE = queue.Queue(maxsize=64)
+
+# Signature of the last compass state pushed to NinjaTrader; unchanged
+# overviews skip the re-broadcast. Reset when fresh market data arrives.
+_NT_BROADCAST_STATE = {"sig": None}
+
+def _nt_broadcast_worker():
+    from ninjatrader_broadcaster import send_regime_update
+    while True:
+        item = _NT_QUEUE.get()
+        try:
+            if isinstance(item, tuple):
+                # (overview_data, compass) — assemble the payload here so the
+                # producer doesn't pay for the dict copy on its hot path.
+                overview, compass = item
+                payload = {**overview, "compass": compass}
+            else:
+                payload = item
+            send_regime_update(payload)
+        except Exception as e:
+            logger.error("NinjaTrader broadcast error: %s", e)
+
+def _queue_nt_broadcast(payload) -> None:
+    """Hands a payload to the NinjaTrader sender thread without blocking."""
+    try:
+        _NT_QUEUE.put_nowait(payload)
+    except queue.Full:
+        pass
+
+def _dispatch_event(msg):
+    """Routes one parsed event to NinjaTrader and the frontend."""
+    logger.debug("Event received: %s", msg.get('type', 'UNKNOWN'))
+
+    # 1. Handle Market Updates (Forward to NinjaTrader)
+    if msg.get('type') == 'MARKET_UPDATE' and 'data' in msg:
+        # New data landed; drop cached dashboard payloads so the next
+        # poll rebuilds from the fresh snapshot.
+        with _DASHBOARD_CACHE_LOCK:
+            _DASHBOARD_CACHE.clear()
+        _NT_BROADCAST_STATE["sig"] = None
+        _queue_nt_broadcast(msg['data'])
+
+    # 2. Forward to Frontend
+    # When calling FROM Python TO JS, we just do eel.JSFunctionName(args)
+    eel.handle_backend_event(msg)
+
+def _accept_event_client(sel, server):
+    client_sock, _addr = server.accept()
+    client_sock.setblocking(False)
+    client_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    # Per-connection read buffer; the message is parsed once the sender
+    # finishes (EOF), so messages larger than one recv are no longer lost.
+    sel.register(client_sock, selectors.EVENT_READ, data=bytearray())
+
+def _service_event_client(sel, key):
+    sock = key.fileobj
+    buffer = key.data
+    closed = False
+    try:
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                closed = True
+                break
+            buffer.extend(chunk)
+    except BlockingIOError:
+        pass
+    except Exception as e:
+        logger.error("Error reading event client: %s", e)
+        closed = True
+
+    # Framed mode: senders prefix each message with a 4-byte big-endian
+    # length, so a connection can stay open and carry many events. Legacy
+    # senders that stream one bare JSON document (buffer starts with '{')
+    # are still parsed once they close their end.
+    if buffer and buffer[0] != 0x7B:  # not '{'
+        while len(buffer) >= 4:
+            (frame_len,) = struct.unpack('>I', buffer[:4])
+            if len(buffer) < 4 + frame_len:
+                break
+            payload = bytes(buffer[4:4 + frame_len])
+            del buffer[:4 + frame_len]
+            try:
+                _dispatch_event(orjson.loads(payload))
+            except Exception as e:
+                logger.error("Error processing event: %s", e)
+
+    if closed:
+        sel.unregister(sock)
+        sock.close()
+        if buffer and buffer[0] == 0x7B:
+            try:
+                _dispatch_event(orjson.loads(bytes(buffer)))
+            except Exception as e:
+                logger.error("Error processing event: %s", e)
+
 def run_event_server(port=5005):
     """
     Listens on a local TCP socket for JSON messages from external scripts
     (like publicData.py) and forwards them to the frontend via Eel.
 
+    Runs a selector (epoll/kqueue) reactor on one thread so multiple
+    producers can be serviced concurrently instead of one blocking
+    accept/recv/close cycle at a time.
+
     Args:
         port: The local port to bind to (default: 5005).
     """
-    print(f"Starting Event Server on port {port}...")
+    logger.info("Starting Event Server on port %s...", port)
+    sel = selectors.DefaultSelector()
     server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     try:
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         server.bind(('127.0.0.1', port))
-        server.listen(5)
+        server.listen(16)
+        server.setblocking(False)
+        sel.register(server, selectors.EVENT_READ, data=None)
 
         while True:
-            client_sock, addr = server.accept()
-            try:
-                data = client_sock.recv(4096)
-                if data:
-                    # Decode and parse
-                    msg = json.loads(data.decode('utf-8'))
-                    print(f"Event received: {msg.get('type', 'UNKNOWN')}")
-
-                    # 1. Handle Market Updates (Forward to NinjaTrader)
-                    if msg.get('type') == 'MARKET_UPDATE' and 'data' in msg:
-                        try:
-                            from ninjatrader_broadcaster import send_regime_update
-                            send_regime_update(msg['data'])
-                            print(f"[Bridge] Forwarded market update to NinjaTrader")
-                        except Exception as e:
-                            print(f"[Bridge] Failed to forward to NinjaTrader: {e}")
-
-                    # 2. Forward to Frontend
-                    # eel.handle_backend_event(msg) # Need to ensuring this function exists in JS
-                    # Eel functions are called as eel.Function()(callback)
-                    # When calling FROM Python TO JS, we just do eel.JSFunctionName(args)
-                    eel.handle_backend_event(msg)
-
-            except Exception as e:
-                print(f"Error processing event: {e}")
-            finally:
-                client_sock.close()
+            for key, _mask in sel.select():
+                if key.data is None:
+                    _accept_event_client(sel, key.fileobj)
+                else:
+                    _service_event_client(sel, key)
 
     except Exception as e:
-        print(f"Event Server Failed to Start: {e}")
+        logger.error("Event Server Failed to Start: %s", e)
     finally:
+        sel.close()
         server.close()
 
 # Start Server in Background Thread
 event_thread = threading.Thread(target=run_event_server, daemon=True)
 event_thread.start()
 
+# Start NinjaTrader broadcast drain thread
+nt_broadcast_thread = threading.Thread(target=_nt_broadcast_worker, daemon=True)
+nt_broadcast_thread.start()
+
 # Start NinjaTrader Broadcast Server (Port 5010)
 try:
     from ninjatrader_broadcaster import start_server as start_nt_server
     start_nt_server(5010)
 except ImportError:
-    print("Could not import ninjatrader_broadcaster")
+    logger.warning("Could not import ninjatrader_broadcaster")
 
 # --- Database Connection ---
-engine = initialize_database(allow_legacy_on_lock=True)
+# The dashboard only reads the DB, so a single shared connection keeps the
+# SQLite page cache warm across Eel calls instead of reopening per request.
+engine = initialize_database(allow_legacy_on_lock=True, shared_connection=True)
+
+_tls = threading.local()
+
+def _db_conn():
+    """Return this thread's long-lived Connection, opening it on first use.
+
+    Eel services each exposed call from worker threads; holding one
+    Connection per thread skips the checkout/teardown churn of a
+    `with engine.connect()` block on every request.
+    """
+    conn = getattr(_tls, "conn", None)
+    if conn is None or conn.closed:
+        conn = engine.connect()
+        _tls.conn = conn
+    return conn
+
 DB_SCHEMA_CURRENT = schema_is_current()
 if not DB_SCHEMA_CURRENT:
-    print("Legacy database schema is still active. Close other DB users and run: python publicData.py --reset-db")
+    logger.warning("Legacy database schema is still active. Close other DB users and run: python publicData.py --reset-db")
+
+# --- Prepared Statements ---
+# Hoisted to module scope so SQLAlchemy reuses the already-built constructs
+# (and their compiled-cache entries) instead of re-parsing the SQL text on
+# every call.
+
+Q_DISTINCT_SYMBOLS = text("SELECT DISTINCT symbol FROM gex_snapshots ORDER BY symbol ASC")
+
+Q_MAX_SNAPSHOT_TS = text("SELECT MAX(timestamp) FROM gex_snapshots")
+
+Q_MAX_SNAPSHOT_TS_FOR_SYMBOL = text("SELECT MAX(timestamp) FROM gex_snapshots WHERE symbol = :symbol")
+
+Q_LATEST_SNAPSHOT = text("""
+    SELECT *
+    FROM gex_snapshots
+    WHERE symbol = :symbol
+    ORDER BY timestamp DESC
+    LIMIT 1
+""")
+
+Q_LATEST_PER_SYMBOL = text("""
+    SELECT * FROM (
+        SELECT *, ROW_NUMBER() OVER (
+            PARTITION BY symbol ORDER BY timestamp DESC
+        ) AS rn
+        FROM gex_snapshots
+        WHERE symbol IN :symbols
+    ) WHERE rn = 1
+""").bindparams(bindparam("symbols", expanding=True))
+
+Q_PROFILE_BY_SNAPSHOT = text("""
+    SELECT strike_price, option_type, gex_value, open_interest
+    FROM raw_option_greeks
+    WHERE snapshot_id = :snapshot_id
+    ORDER BY strike_price ASC
+""")
+
+Q_PROFILE_BY_TIME = text("""
+    SELECT strike_price, option_type, gex_value, open_interest
+    FROM raw_option_greeks
+    WHERE symbol = :symbol AND timestamp = :ts
+    ORDER BY strike_price ASC
+""")
+
+Q_GEX_PROFILE_BY_SNAPSHOT = text("""
+    SELECT strike_price, gex_value
+    FROM raw_option_greeks
+    WHERE snapshot_id = :snapshot_id
+""")
+
+Q_GEX_PROFILE_BY_TIME = text("""
+    SELECT strike_price, gex_value
+    FROM raw_option_greeks
+    WHERE symbol = :symbol AND timestamp = :ts
+""")
+
+Q_LEVELS_BY_SNAPSHOT = text("""
+    SELECT strike_price, SUM(gex_value) AS net_gex
+    FROM raw_option_greeks
+    WHERE snapshot_id = :snapshot_id
+    GROUP BY strike_price
+""")
+
+Q_LEVELS_BY_TIME = text("""
+    SELECT strike_price, SUM(gex_value) AS net_gex
+    FROM raw_option_greeks
+    WHERE symbol = :symbol AND timestamp = :ts
+    GROUP BY strike_price
+""")
+
+# Latest snapshot and history rows in one round-trip; rows are split by tag
+# in Python. History columns line up with the snapshot columns it shares and
+# the rest are padded with NULLs.
+Q_SNAP_AND_HISTORY = text("""
+    SELECT * FROM (
+        SELECT 'S' AS tag, id, timestamp, spot_price, total_net_gex,
+               max_call_gex_strike, max_put_gex_strike
+        FROM gex_snapshots
+        WHERE symbol = :symbol
+        ORDER BY timestamp DESC
+        LIMIT 1
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'H' AS tag, NULL AS id, timestamp, spot_price, total_net_gex,
+               NULL AS max_call_gex_strike, NULL AS max_put_gex_strike
+        FROM gex_snapshots
+        WHERE symbol = :symbol
+        ORDER BY timestamp DESC
+        LIMIT :n
+    )
+""")
+
+Q_HISTORY_BUCKETED = text("""
+    SELECT timestamp, total_net_gex, spot_price
+    FROM (
+        SELECT MAX(timestamp) AS timestamp,
+               AVG(total_net_gex) AS total_net_gex,
+               AVG(spot_price) AS spot_price
+        FROM gex_snapshots
+        WHERE symbol = :symbol
+        GROUP BY CAST(strftime('%s', timestamp) / :bucket AS INT)
+        ORDER BY timestamp DESC
+        LIMIT :n
+    )
+    ORDER BY timestamp ASC
+""")
+
+SETTINGS_PATH = 'settings.json'
+
+# Parsed settings keyed on the file's mtime so hot dashboard polls skip the
+# disk read + JSON parse unless settings.json actually changed.
+_SETTINGS_CACHE = {"mtime": 0, "data": None}
 
 def _load_settings() -> dict:
     try:
-        with open('settings.json', encoding='utf-8') as f:
-            settings = json.load(f)
+        mtime = os.stat(SETTINGS_PATH).st_mtime_ns
     except FileNotFoundError:
-        settings = {}
-    merged = DEFAULT_SETTINGS.copy()
-    merged.update(settings)
-    return merged
+        mtime = 0
+
+    if _SETTINGS_CACHE["data"] is None or _SETTINGS_CACHE["mtime"] != mtime:
+        try:
+            with open(SETTINGS_PATH, 'rb') as f:
+                settings = orjson.loads(f.read())
+        except FileNotFoundError:
+            settings = {}
+        merged = DEFAULT_SETTINGS.copy()
+        merged.update(settings)
+        _SETTINGS_CACHE["data"] = merged
+        _SETTINGS_CACHE["mtime"] = mtime
+
+    return _SETTINGS_CACHE["data"]
 
 def _normalized_composition(target_weights: dict) -> str:
     total = sum(float(w or 0) for w in target_weights.values())
@@ -333,9 +626,9 @@ def get_symbols() -> list[str]:
     Returns:
         A list of symbol strings (e.g., ["SPY", "QQQ"]).
     """
-    with engine.connect() as conn:
-        result = conn.execute(text("SELECT DISTINCT symbol FROM gex_snapshots ORDER BY symbol ASC"))
-        return [r[0] for r in result]
+    conn = _db_conn()
+    result = conn.execute(Q_DISTINCT_SYMBOLS)
+    return [r[0] for r in result]
 
 @eel.expose
 def get_settings() -> dict:
@@ -344,7 +637,8 @@ def get_settings() -> dict:
     Returns:
         A dictionary containing settings from `settings.json`.
     """
-    return _load_settings()
+    # Hand the frontend a copy so callers can't mutate the shared cache.
+    return dict(_load_settings())
 
 @eel.expose
 def save_settings(new_settings: dict) -> bool:
@@ -359,24 +653,45 @@ def save_settings(new_settings: dict) -> bool:
     Returns:
         True if successful.
     """
-    import json
     try:
         # Load existing manually to preserve hidden keys (like 'weights')
-        with open('settings.json', 'r', encoding='utf-8') as f:
-            existing = json.load(f)
+        with open(SETTINGS_PATH, 'rb') as f:
+            existing = orjson.loads(f.read())
     except FileNotFoundError:
         existing = {}
 
     # Merge new settings into existing
     existing.update(new_settings)
 
-    with open('settings.json', 'w', encoding='utf-8') as f:
-        json.dump(existing, f, indent=2)
-    print(f"Settings merged and saved: {existing.keys()}")
+    # Write to a temp file and rename so a crash mid-write can never leave
+    # settings.json half-written.
+    fd, tmp_path = tempfile.mkstemp(dir='.', prefix='.settings.', suffix='.json')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps(existing, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, SETTINGS_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    # Refresh the cache directly so readers see the new values without
+    # re-reading the file we just wrote.
+    merged = DEFAULT_SETTINGS.copy()
+    merged.update(existing)
+    _SETTINGS_CACHE["data"] = merged
+    _SETTINGS_CACHE["mtime"] = os.stat(SETTINGS_PATH).st_mtime_ns
+
+    logger.debug("Settings merged and saved: %s", existing.keys())
     return True
 
+# Dashboard payloads keyed on the symbol's newest snapshot timestamp; the
+# frontend polls far more often than the collector writes, so repeat polls
+# reuse the built response. MARKET_UPDATE events clear it defensively.
+_DASHBOARD_CACHE = {}
+_DASHBOARD_CACHE_LOCK = threading.Lock()
+
 @eel.expose
-def get_dashboard_data(symbol: str = "SPY") -> dict:
+def get_dashboard_data(symbol: str = "SPY", n: int = 100, bucket_sec: int = 0) -> dict:
     """Fetches comprehensive dashboard data for a specific symbol.
 
     Retrieves the latest snapshot, option profile (strike vs GEX), and
@@ -384,6 +699,10 @@ def get_dashboard_data(symbol: str = "SPY") -> dict:
 
     Args:
         symbol: The ticker symbol to fetch (default: "SPY").
+        n: Maximum number of history points to return (default: 100).
+        bucket_sec: When > 0, history is averaged into buckets of this many
+            seconds before applying the limit, downsampling long histories
+            server-side.
 
     Returns:
         A dictionary containing:
@@ -393,90 +712,120 @@ def get_dashboard_data(symbol: str = "SPY") -> dict:
             - error (str): If data is missing or query fails.
     """
     try:
-        with engine.connect() as conn:
-            # 1. Get Latest Snapshot
-            query_snap = text("""
-                SELECT *
-                FROM gex_snapshots
-                WHERE symbol = :symbol
-                ORDER BY timestamp DESC
-                LIMIT 1
-            """)
-            snap_row = conn.execute(query_snap, {"symbol": symbol}).fetchone()
+        conn = _db_conn()
+
+        # 0. Serve from cache while the symbol's newest snapshot is unchanged
+        latest_db_ts = conn.execute(Q_MAX_SNAPSHOT_TS_FOR_SYMBOL, {"symbol": symbol}).scalar()
+        cache_key = (symbol, n, bucket_sec)
+        with _DASHBOARD_CACHE_LOCK:
+            cached = _DASHBOARD_CACHE.get(cache_key)
+            if cached is not None and latest_db_ts is not None and cached[0] == latest_db_ts:
+                return cached[1]
+
+        # 1. Get Latest Snapshot + History in one round-trip
+        snap_row = None
+        hist_rows = []
+        if bucket_sec > 0:
+            snap_row = conn.execute(Q_LATEST_SNAPSHOT, {"symbol": symbol}).fetchone()
+        else:
+            for r in conn.execute(Q_SNAP_AND_HISTORY, {"symbol": symbol, "n": n}):
+                if r.tag == 'S':
+                    snap_row = r
+                else:
+                    hist_rows.append(r)
 
-            if not snap_row:
-                return {
-                    "error": f"No data found for {symbol}. Run publicData.py for strict target-day 0DTE collection.",
-                    "snapshot": None,
-                    "profile": [],
-                    "history": []
-                }
+        if not snap_row:
+            return {
+                "error": f"No data found for {symbol}. Run publicData.py for strict target-day 0DTE collection.",
+                "snapshot": None,
+                "profile": [],
+                "history": []
+            }
 
-            latest_time = snap_row.timestamp
+        latest_time = snap_row.timestamp
+
+        # 2. Fetch Profile Data (For the Bar Chart & Table)
+        # We need raw rows to separate Calls vs Puts in JS
+        if DB_SCHEMA_CURRENT:
+            profile_rows = conn.execute(Q_PROFILE_BY_SNAPSHOT, {"snapshot_id": snap_row.id}).fetchall()
+        else:
+            profile_rows = conn.execute(Q_PROFILE_BY_TIME, {"symbol": symbol, "ts": latest_time}).fetchall()
+
+        # Columnar (struct-of-arrays) profile: one key string per column
+        # instead of four per row, roughly halving the serialized payload.
+        p_strike, p_type, p_gex, p_oi = [], [], [], []
+        for r in profile_rows:
+            p_strike.append(r.strike_price)
+            p_type.append(r.option_type)
+            p_gex.append(r.gex_value)
+            p_oi.append(r.open_interest)
+        profile = {
+            "strike_price": p_strike,
+            "option_type": p_type,
+            "gex_value": p_gex,
+            "open_interest": p_oi,
+        }
 
-            # 2. Fetch Profile Data (For the Bar Chart & Table)
-            # We need raw rows to separate Calls vs Puts in JS
-            if DB_SCHEMA_CURRENT:
-                query_profile = text("""
-                    SELECT strike_price, option_type, gex_value, open_interest
-                    FROM raw_option_greeks
-                    WHERE snapshot_id = :snapshot_id
-                    ORDER BY strike_price ASC
-                """)
-                df_profile = pd.read_sql(query_profile, conn, params={"snapshot_id": snap_row.id})
-            else:
-                query_profile = text("""
-                    SELECT strike_price, option_type, gex_value, open_interest
-                    FROM raw_option_greeks
-                    WHERE symbol = :symbol AND timestamp = :ts
-                    ORDER BY strike_price ASC
-                """)
-                df_profile = pd.read_sql(query_profile, conn, params={"symbol": symbol, "ts": latest_time})
-
-            # Convert Row to Dict safely
-            spot = snap_row.spot_price or 0
-            snapshot = {
-                "symbol": symbol,
-                "timestamp": str(latest_time),
-                "spot_price": spot,
-                "total_net_gex": snap_row.total_net_gex or 0,
-                "max_call_gex_strike": snap_row.max_call_gex_strike or 0,
-                "max_put_gex_strike": snap_row.max_put_gex_strike or 0,
-                "gex_slope": calculate_gex_slope(spot, df_profile.to_dict(orient='records'))
-            }
+        # Convert Row to Dict safely
+        spot = snap_row.spot_price or 0
+        snapshot = {
+            "symbol": symbol,
+            "timestamp": str(latest_time),
+            "spot_price": spot,
+            "total_net_gex": snap_row.total_net_gex or 0,
+            "max_call_gex_strike": snap_row.max_call_gex_strike or 0,
+            "max_put_gex_strike": snap_row.max_put_gex_strike or 0,
+            "gex_slope": calculate_gex_slope(spot, p_strike, p_gex)
+        }
 
-            # 4. Fetch History (For the Line Chart)
-            query_history = text("""
-                SELECT timestamp, total_net_gex, spot_price
-                FROM (
-                    SELECT timestamp, total_net_gex, spot_price
-                    FROM gex_snapshots
-                    WHERE symbol = :symbol
-                    ORDER BY timestamp DESC
-                    LIMIT 100
-                )
-                ORDER BY timestamp ASC
-            """)
-            df_hist = pd.read_sql(query_history, conn, params={"symbol": symbol})
-
-            # Convert timestamps to string for JSON
-            df_hist['timestamp'] = df_hist['timestamp'].apply(lambda x: str(x))
-
-            # Structure for Frontend
-            return {
-                "snapshot": snapshot,
-                "profile": df_profile.to_dict(orient='records'),
-                "history": df_hist.to_dict(orient='records')
+        # 4. Assemble History (For the Line Chart)
+        if bucket_sec > 0:
+            hist_rows = conn.execute(Q_HISTORY_BUCKETED, {"symbol": symbol, "bucket": bucket_sec, "n": n}).fetchall()
+        else:
+            # The combined query selects the newest rows; charts want
+            # chronological order.
+            hist_rows.sort(key=lambda r: r.timestamp)
+        history = [
+            {
+                "timestamp": str(r.timestamp),
+                "total_net_gex": r.total_net_gex,
+                "spot_price": r.spot_price,
             }
+            for r in hist_rows
+        ]
+
+        # Structure for Frontend
+        result = {
+            "snapshot": snapshot,
+            "profile": profile,
+            "history": history
+        }
+        with _DASHBOARD_CACHE_LOCK:
+            _DASHBOARD_CACHE[cache_key] = (latest_db_ts, result)
+        return result
 
     except Exception as e:
-        print(f"Error: {e}")
+        logger.error("Error: %s", e)
         return {"error": str(e)}
 
+# Overview results keyed on the newest snapshot timestamp; the data only
+# changes when the collector writes, so back-to-back polls share one result.
+_OVERVIEW_CACHE = {"ts": None, "data": None, "exp": 0.0}
+_OVERVIEW_TTL_SECONDS = 5.0
+
 @eel.expose
 def get_market_overview() -> dict:
     try:
-        import math
+        now = time.monotonic()
+        cached = _OVERVIEW_CACHE["data"]
+        if cached is not None and now < _OVERVIEW_CACHE["exp"]:
+            return cached
+
+        conn = _db_conn()
+        latest_ts = conn.execute(Q_MAX_SNAPSHOT_TS).scalar()
+        if cached is not None and latest_ts is not None and latest_ts == _OVERVIEW_CACHE["ts"]:
+            _OVERVIEW_CACHE["exp"] = now + _OVERVIEW_TTL_SECONDS
+            return cached
 
         settings = _load_settings()
 
@@ -492,37 +841,21 @@ def get_market_overview() -> dict:
             "gamma_levels": {"NDX": [], "SPX": []}
         }
 
-        def _gamma_levels_for_symbol(symbol, conn, per_side=5):
-            snap_row = conn.execute(
-                text("SELECT * FROM gex_snapshots WHERE symbol = :symbol ORDER BY timestamp DESC LIMIT 1"),
-                {"symbol": symbol}
-            ).fetchone()
+        def _gamma_levels_for_symbol(symbol, snap_row, conn, per_side=5):
             if not snap_row:
                 return []
 
             if DB_SCHEMA_CURRENT:
-                query_levels = text("""
-                    SELECT strike_price, SUM(gex_value) AS net_gex
-                    FROM raw_option_greeks
-                    WHERE snapshot_id = :snapshot_id
-                    GROUP BY strike_price
-                """)
-                level_rows = conn.execute(query_levels, {"snapshot_id": snap_row.id}).fetchall()
+                level_rows = conn.execute(Q_LEVELS_BY_SNAPSHOT, {"snapshot_id": snap_row.id}).fetchall()
             else:
-                query_levels = text("""
-                    SELECT strike_price, SUM(gex_value) AS net_gex
-                    FROM raw_option_greeks
-                    WHERE symbol = :symbol AND timestamp = :ts
-                    GROUP BY strike_price
-                """)
-                level_rows = conn.execute(query_levels, {"symbol": symbol, "ts": snap_row.timestamp}).fetchall()
-
-            spot = getattr(snap_row, 'spot_price', 0) or 0
+                level_rows = conn.execute(Q_LEVELS_BY_TIME, {"symbol": symbol, "ts": snap_row.timestamp}).fetchall()
+
+            spot = snap_row._mapping.get('spot_price') or 0
             below = []
             above = []
-            for row in level_rows:
-                gex = getattr(row, 'net_gex', 0) or 0
-                strike = getattr(row, 'strike_price', 0) or 0
+            for strike, gex in level_rows:
+                gex = gex or 0
+                strike = strike or 0
                 if strike <= 0 or gex == 0:
                     continue
 
@@ -542,9 +875,10 @@ def get_market_overview() -> dict:
             )
             return sorted(selected, key=lambda item: item["strike"])
 
-        def _calculate_compass_state(target_weights, conn):
+        def _calculate_compass_state(target_weights, latest_rows, conn):
             x_score_sum = 0
             y_score_sum = 0
+            weighted_confidence_sum = 0
             total_weight = 0
             components = []
 
@@ -552,37 +886,29 @@ def get_market_overview() -> dict:
             composition_str = _normalized_composition(target_weights)
 
             for symbol, weight in target_weights.items():
-                # Fetch latest snapshot
-                query = text("SELECT * FROM gex_snapshots WHERE symbol = :symbol ORDER BY timestamp DESC LIMIT 1")
-                row = conn.execute(query, {"symbol": symbol}).fetchone()
+                # Latest snapshot from the shared batched lookup
+                row = latest_rows.get(symbol)
 
                 if row:
-                    # Safe Extraction
-                    net_gex = getattr(row, 'total_net_gex', 0)
-                    call_gex = getattr(row, 'total_call_gex', 0) or 0
-                    put_gex = getattr(row, 'total_put_gex', 0) or 0
-                    spot = getattr(row, 'spot_price', 0)
-                    stored_flip = getattr(row, 'flip_strike', 0) or 0
-                    eff_gex = getattr(row, 'effective_gex', 0)
+                    # Safe Extraction via the row mapping (cheaper than
+                    # attribute descriptor lookups per column)
+                    m = row._mapping
+                    net_gex = m.get('total_net_gex') or 0
+                    call_gex = m.get('total_call_gex') or 0
+                    put_gex = m.get('total_put_gex') or 0
+                    spot = m.get('spot_price') or 0
+                    stored_flip = m.get('flip_strike') or 0
+                    eff_gex = m.get('effective_gex') or 0
                     # Fetch Profile for slope calculation
                     if DB_SCHEMA_CURRENT:
-                        query_profile = text("""
-                            SELECT strike_price, gex_value
-                            FROM raw_option_greeks
-                            WHERE snapshot_id = :snapshot_id
-                        """)
-                        profile_rows = conn.execute(query_profile, {"snapshot_id": row.id}).fetchall()
+                        profile_rows = conn.execute(Q_GEX_PROFILE_BY_SNAPSHOT, {"snapshot_id": row.id}).fetchall()
                     else:
-                        query_profile = text("""
-                            SELECT strike_price, gex_value
-                            FROM raw_option_greeks
-                            WHERE symbol = :symbol AND timestamp = :ts
-                        """)
-                        profile_rows = conn.execute(query_profile, {"symbol": symbol, "ts": row.timestamp}).fetchall()
-                    profile_data = [{"strike_price": r.strike_price, "gex_value": r.gex_value} for r in profile_rows]
-                    acceleration = calculate_gex_slope(spot, profile_data)
-
-                    flip_state = estimate_flip_from_profile(profile_data, spot)
+                        profile_rows = conn.execute(Q_GEX_PROFILE_BY_TIME, {"symbol": symbol, "ts": row.timestamp}).fetchall()
+                    profile_strikes = [r.strike_price for r in profile_rows]
+                    profile_gex = [r.gex_value for r in profile_rows]
+                    acceleration = calculate_gex_slope(spot, profile_strikes, profile_gex)
+
+                    flip_state = estimate_flip_from_profile(profile_strikes, profile_gex, spot)
                     if flip_state["strike"] == 0 and stored_flip > 0:
                         flip_state = {
                             "strike": stored_flip,
@@ -594,10 +920,14 @@ def get_market_overview() -> dict:
                     gross_gex = abs(call_gex) + abs(put_gex)
 
                     # --- 1. TREND SCORE (Y-AXIS) ---
-                    # Uses the 0DTE sensitivity logic, damped when the flip is approximate.
+                    # Uses the 0DTE sensitivity logic, damped when the flip is
+                    # approximate. Inlined from calculate_0dte_trend_score to
+                    # keep call/dict overhead out of the per-symbol loop.
                     if flip and flip > 0:
-                        dist_pct = ((spot - flip) / flip) * 100
-                        trend_score = calculate_0dte_trend_score(spot, flip, symbol) * flip_state["confidence"]
+                        dist_raw = (spot - flip) / flip
+                        dist_pct = dist_raw * 100
+                        sensitivity = SENSITIVITY_MAP.get(symbol, SENSITIVITY_MAP["DEFAULT"])
+                        trend_score = max(-1.0, min(1.0, dist_raw / sensitivity)) * flip_state["confidence"]
                     else:
                         dist_pct = 0
                         trend_score = 0
@@ -606,11 +936,13 @@ def get_market_overview() -> dict:
                     # Net-vs-gross imbalance keeps tiny and massive one-sided
                     # profiles from receiving the same score.
                     vol_score, gex_imbalance = calculate_gex_imbalance_score(net_gex, call_gex, put_gex)
-                    quality = calculate_component_confidence(row, len(profile_data), flip_state, gross_gex)
+                    quality = calculate_component_confidence(row, len(profile_strikes), flip_state, gross_gex)
 
-                    # Add to aggregates
+                    # Add to aggregates (confidence accumulated here instead
+                    # of in a second pass over components)
                     x_score_sum += vol_score * weight
                     y_score_sum += trend_score * weight
+                    weighted_confidence_sum += quality["score"] * weight
                     total_weight += weight
 
                     # Regime Label for individual component
@@ -654,40 +986,17 @@ def get_market_overview() -> dict:
             if total_weight > 0:
                 final_vol = x_score_sum / total_weight
                 final_trend = y_score_sum / total_weight
-                weighted_confidence = sum([c['confidence'] * target_weights.get(c['symbol'], 0) for c in components])
-                confidence = weighted_confidence / total_weight
+                confidence = weighted_confidence_sum / total_weight
             else:
                 final_vol, final_trend, confidence = 0, 0, 0
 
             # Magnitude
-            magnitude = math.sqrt(final_vol**2 + final_trend**2)
-
-            # Determine Quadrant
-            is_pos_gex = final_vol > 0
-            is_bull_trend = final_trend > 0
+            magnitude = math.hypot(final_vol, final_trend)
 
             # --- REGIME CONTEXT LOGIC ---
-            base_lbl, base_strat, base_icon = "", "", ""
-
-            if is_pos_gex:
-                if is_bull_trend:
-                    base_lbl = "GRIND UP"
-                    base_strat = "Positive gamma with spot above flip. Favor controlled upside and mean-reversion on pullbacks."
-                    base_icon = "🟢"
-                else:
-                    base_lbl = "SUPPORT / CHOP"
-                    base_strat = "Positive gamma below flip. Favor range discipline and mean-reversion; watch for failed breakdowns."
-                    base_icon = "⚪"
-            else:
-                # Negative Gamma
-                if is_bull_trend:
-                    base_lbl = "MELT UP"
-                    base_strat = "Negative gamma with spot above flip. Favor momentum and upside range expansion; avoid early fades."
-                    base_icon = "🟡"
-                else:
-                    base_lbl = "CRASH / FLUSH"
-                    base_strat = "Negative gamma below flip. Watch for downside range expansion; momentum can persist."
-                    base_icon = "🔴"
+            # Quadrant lookup: (pos_gamma << 1) | bull_trend
+            quadrant = (int(final_vol > 0) << 1) | int(final_trend > 0)
+            base_lbl, base_strat, base_icon = _COMPASS_QUADRANTS[quadrant]
 
             # Inner Ring Check
             inner_ring_threshold = 0.25
@@ -722,96 +1031,196 @@ def get_market_overview() -> dict:
                 "raw_components": components
             }
 
-        with engine.connect() as conn:
-            # 1. Calculate Traders Compass
-            traders_state = _calculate_compass_state(weights_traders, conn)
-            overview_data["compass_traders"] = traders_state
-
-            # 2. Calculate Whale Compass
-            whale_state = _calculate_compass_state(weights_whale, conn)
-            overview_data["compass_whale"] = whale_state
-
-            # 3. Merge Unique Components for Table/Tilt Chart
-            merged_comps = {}
-            def add_comps(comp_list):
-                for c in comp_list:
-                    merged_comps[c['symbol']] = c
-
-            add_comps(traders_state['raw_components'])
-            add_comps(whale_state['raw_components'])
-
-            for sym, data in merged_comps.items():
-                overview_data["components"].append({
-                    "symbol": data['symbol'],
-                    "spot": data['spot'],
-                    "flip_strike": data['flip_strike'],
-                    "distance_pct": data.get('distance_pct', 0),
-                    "net_gex": data['net_gex'],
-                    "regime": data['regime'],
-                    "acceleration": data.get('acceleration', 0),
-                    "vol_score": data.get('vol_score', 0),
-                    "trend_score": data.get('trend_score', 0),
-                    "gex_imbalance": data.get('gex_imbalance', 0),
-                    "gross_gex": data.get('gross_gex', 0),
-                    "confidence": data.get('confidence', 0),
-                    "warnings": data.get('warnings', []),
-                    "age_seconds": data.get('age_seconds'),
-                    "flip_quality": data.get('flip_quality', 'missing'),
-                    "flip_note": data.get('flip_note', '')
-                })
-                # Add Tilt Data
-                overview_data["tilt"].append({
-                    "symbol": data['symbol'],
-                    "net_gex": data.get('effective_gex', 0)
-                })
-
-            for idx_symbol in ["NDX", "SPX"]:
-                overview_data["gamma_levels"][idx_symbol] = _gamma_levels_for_symbol(idx_symbol, conn)
-
-        # Broadcast
-        try:
-            from ninjatrader_broadcaster import send_regime_update
-            broadcast_payload = overview_data.copy()
-            # Default to Traders for simple clients
-            broadcast_payload['compass'] = overview_data['compass_traders']
-            send_regime_update(broadcast_payload)
-        except Exception as e:
-            print(f"NinjaTrader broadcast error: {e}")
+        conn = _db_conn()
+        # 0. Fetch the latest snapshot for every symbol of interest in one
+        # windowed query instead of one round-trip per symbol per compass.
+        symbols = sorted(set(weights_traders) | set(weights_whale) | {"NDX", "SPX"})
+        latest_rows = {}
+        if symbols:
+            for row in conn.execute(Q_LATEST_PER_SYMBOL, {"symbols": symbols}):
+                latest_rows[row.symbol] = row
+
+        # 1. Calculate Traders Compass
+        traders_state = _calculate_compass_state(weights_traders, latest_rows, conn)
+        overview_data["compass_traders"] = traders_state
+
+        # 2. Calculate Whale Compass
+        whale_state = _calculate_compass_state(weights_whale, latest_rows, conn)
+        overview_data["compass_whale"] = whale_state
+
+        # 3. Merge Unique Components for Table/Tilt Chart
+        merged_comps = {}
+        def add_comps(comp_list):
+            for c in comp_list:
+                merged_comps[c['symbol']] = c
+
+        add_comps(traders_state['raw_components'])
+        add_comps(whale_state['raw_components'])
+
+        # Symbol-keyed view of the same components so downstream consumers
+        # (e.g. the NinjaTrader payload builder) do dict lookups, not scans.
+        overview_data["_components_by_symbol"] = merged_comps
+
+        for sym, data in merged_comps.items():
+            overview_data["components"].append({
+                "symbol": data['symbol'],
+                "spot": data['spot'],
+                "flip_strike": data['flip_strike'],
+                "distance_pct": data.get('distance_pct', 0),
+                "net_gex": data['net_gex'],
+                "regime": data['regime'],
+                "acceleration": data.get('acceleration', 0),
+                "vol_score": data.get('vol_score', 0),
+                "trend_score": data.get('trend_score', 0),
+                "gex_imbalance": data.get('gex_imbalance', 0),
+                "gross_gex": data.get('gross_gex', 0),
+                "confidence": data.get('confidence', 0),
+                "warnings": data.get('warnings', []),
+                "age_seconds": data.get('age_seconds'),
+                "flip_quality": data.get('flip_quality', 'missing'),
+                "flip_note": data.get('flip_note', '')
+            })
+            # Add Tilt Data
+            overview_data["tilt"].append({
+                "symbol": data['symbol'],
+                "net_gex": data.get('effective_gex', 0)
+            })
+
+        for idx_symbol in ["NDX", "SPX"]:
+            overview_data["gamma_levels"][idx_symbol] = _gamma_levels_for_symbol(
+                idx_symbol, latest_rows.get(idx_symbol), conn
+            )
+
+        # Broadcast, unless the compass state is identical to the last
+        # broadcast; re-pushing an unchanged regime to every NT chart is
+        # wasted encode + socket work. The worker thread assembles the
+        # payload, defaulting the compass to Traders for simple clients.
+        sig = (
+            round(traders_state.get("x_score", 0), 4),
+            round(traders_state.get("y_score", 0), 4),
+            traders_state.get("label", ""),
+        )
+        if sig != _NT_BROADCAST_STATE["sig"]:
+            _NT_BROADCAST_STATE["sig"] = sig
+            _queue_nt_broadcast((overview_data, overview_data['compass_traders']))
+
+        _OVERVIEW_CACHE["ts"] = latest_ts
+        _OVERVIEW_CACHE["data"] = overview_data
+        _OVERVIEW_CACHE["exp"] = now + _OVERVIEW_TTL_SECONDS
 
         return overview_data
 
     except Exception as e:
-        print(f"Error in market overview: {e}")
+        logger.error("Error in market overview: %s", e)
         return {"error": str(e)}
 
+# Currently running collector pass (in-process future or subprocess),
+# used to coalesce concurrent triggers.
+_REFRESH_STATE = {"proc": None, "future": None}
+_REFRESH_LOCK = threading.Lock()
+# Single worker so a second trigger can never overlap a running pass.
+_REFRESH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="refresh")
+
+def _run_refresh_inprocess() -> None:
+    """Runs one collector pass in this process and reports to the frontend."""
+    import publicData  # deferred: pulls in the collector's heavy imports
+
+    try:
+        result = publicData.main_once()
+    except Exception as e:
+        result = {"ok": False, "message": str(e), "run_id": None}
+
+    with _REFRESH_LOCK:
+        _REFRESH_STATE["future"] = None
+
+    logger.info("Data refresh complete: %s", result.get('message'))
+    try:
+        eel.handle_backend_event({"type": "REFRESH_DONE", "pid": os.getpid(), "result": result})
+    except Exception as e:
+        logger.error("Failed to notify frontend of refresh completion: %s", e)
+
+def _watch_refresh(proc) -> None:
+    """Streams a collector subprocess's output and reports the result.
+
+    Each stdout line is forwarded to the frontend as a REFRESH_PROGRESS
+    event while the collector runs; the final line is parsed as the
+    structured result, as before.
+    """
+    lines = []
+    for raw_line in proc.stdout:
+        line = raw_line.rstrip()
+        if not line:
+            continue
+        lines.append(line)
+        try:
+            eel.handle_backend_event({"type": "REFRESH_PROGRESS", "pid": proc.pid, "line": line})
+        except Exception as e:
+            logger.debug("Failed to stream refresh progress: %s", e)
+    proc.wait()
+
+    result = None
+    if lines:
+        try:
+            result = orjson.loads(lines[-1])
+        except orjson.JSONDecodeError:
+            result = None
+    if result is None:
+        message = "\n".join(lines) or "Collector finished without a structured result."
+        result = {"ok": proc.returncode == 0, "message": message, "run_id": None}
+
+    with _REFRESH_LOCK:
+        if _REFRESH_STATE["proc"] is proc:
+            _REFRESH_STATE["proc"] = None
+
+    logger.info("Data refresh complete: %s", result.get('message'))
+    try:
+        eel.handle_backend_event({"type": "REFRESH_DONE", "pid": proc.pid, "result": result})
+    except Exception as e:
+        logger.error("Failed to notify frontend of refresh completion: %s", e)
+
 @eel.expose
 def trigger_data_refresh() -> dict:
-    """Invokes the data collector script (publicData.py) immediately.
+    """Starts one collector pass (publicData) in the background.
 
-    Spawns a subprocess using the current Python interpreter.
+    Prefers running the collector in-process on a dedicated worker thread,
+    which skips interpreter startup and reuses this process's warm engine;
+    falls back to spawning publicData.py as a subprocess if the collector
+    module cannot be imported. Returns immediately so Eel worker threads
+    stay free; completion is delivered to the frontend as a REFRESH_DONE
+    backend event.
 
     Returns:
-        A structured result from the collector.
+        A dict with ok/message/pid describing whether the refresh started.
     """
-    import subprocess
-    import sys
     try:
-        print("Triggering data refresh...")
-        # Run publicData.py using the same python interpreter
-        proc = subprocess.run([sys.executable, "publicData.py", "--once"], capture_output=True, text=True)
-        output = (proc.stdout or "").strip().splitlines()
-        if output:
+        with _REFRESH_LOCK:
+            future = _REFRESH_STATE["future"]
+            if future is not None and not future.done():
+                return {"ok": False, "message": "A data refresh is already running.", "run_id": None, "pid": os.getpid()}
+            proc = _REFRESH_STATE["proc"]
+            if proc is not None and proc.poll() is None:
+                return {"ok": False, "message": "A data refresh is already running.", "run_id": None, "pid": proc.pid}
+            logger.info("Triggering data refresh...")
             try:
-                result = json.loads(output[-1])
-                print(f"Data refresh complete: {result.get('message')}")
-                return result
-            except json.JSONDecodeError:
-                pass
-        message = (proc.stderr or proc.stdout or "Collector finished without a structured result.").strip()
-        return {"ok": proc.returncode == 0, "message": message, "run_id": None}
+                import publicData  # noqa: F401 -- probe; the worker re-imports
+            except ImportError:
+                publicData = None
+            if publicData is not None:
+                _REFRESH_STATE["future"] = _REFRESH_POOL.submit(_run_refresh_inprocess)
+                return {"ok": True, "message": "Data refresh started.", "run_id": None, "pid": os.getpid()}
+            proc = subprocess.Popen(
+                [sys.executable, "publicData.py", "--once"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+            _REFRESH_STATE["proc"] = proc
+
+        threading.Thread(target=_watch_refresh, args=(proc,), daemon=True).start()
+        return {"ok": True, "message": "Data refresh started.", "run_id": None, "pid": proc.pid}
     except Exception as e:
-        print(f"Failed to refresh data: {e}")
-        return {"ok": False, "message": str(e), "run_id": None}
+        logger.error("Failed to refresh data: %s", e)
+        return {"ok": False, "message": str(e), "run_id": None, "pid": None}
 
 # --- Run App ---
 if __name__ == '__main__':
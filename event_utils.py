@@ -1,15 +1,33 @@
 import socket
-import json
 import logging
+import struct
+import threading
+
+import orjson
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# One keep-alive connection to the event server, reused across send_event
+# calls so each event costs a single send instead of a TCP handshake plus
+# teardown. Rebuilt lazily if the Dashboard restarts.
+_SOCK = None
+_SOCK_PORT = None
+_SOCK_LOCK = threading.Lock()
+
+
+def _connect(port: int) -> socket.socket:
+    s = socket.create_connection(('127.0.0.1', port), timeout=5)
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return s
+
+
 def send_event(event_type: str, payload: dict, port: int = 5005) -> None:
     """Sends a JSON event to the local notification server.
 
     Used by external scripts (like publicData.py) to push updates to the
-    main Dashboard backend (appy.py).
+    main Dashboard backend (appy.py). Reuses a persistent connection and
+    reconnects once if the server has gone away since the last send.
 
     Args:
         event_type: A string identifier for the event (e.g., 'magnet_change').
@@ -22,18 +40,34 @@ def send_event(event_type: str, payload: dict, port: int = 5005) -> None:
     Raises:
         ConnectionRefusedError: If the Dashboard backend is not running.
     """
+    global _SOCK, _SOCK_PORT
     try:
         message = {
             "type": event_type,
             "payload": payload
         }
-        json_msg = json.dumps(message)
-        
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(5) # Increased timeout to 5s to handle load
-            s.connect(('127.0.0.1', port))
-            s.sendall(json_msg.encode('utf-8'))
-            
+        json_msg = orjson.dumps(message)
+        # 4-byte big-endian length prefix so the server can frame messages
+        # on the shared connection.
+        frame = struct.pack('>I', len(json_msg)) + json_msg
+
+        with _SOCK_LOCK:
+            for attempt in (0, 1):
+                if _SOCK is None or _SOCK_PORT != port:
+                    _SOCK = _connect(port)
+                    _SOCK_PORT = port
+                try:
+                    _SOCK.sendall(frame)
+                    return
+                except (BrokenPipeError, ConnectionResetError, OSError):
+                    try:
+                        _SOCK.close()
+                    except OSError:
+                        pass
+                    _SOCK = None
+                    if attempt:
+                        raise
+
     except ConnectionRefusedError:
         logger.warning(f"Could not connect to Event Server on port {port}. Is the Dashboard open?")
     except Exception as e:
@@ -4,8 +4,9 @@ import sqlite3
 from datetime import datetime
 from pathlib import Path
 
-from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, Index, Integer, String, Text, create_engine
+from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, Index, Integer, String, Text, create_engine, event
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 
 DB_CONNECTION_STR = "sqlite:///gex_data.db"
@@ -52,6 +53,10 @@ class GexSnapshot(Base):
     effective_gex = Column(Float)
     total_gamma = Column(Float, default=0.0)
     total_theta = Column(Float, default=0.0)
+    # Persisted so "previous magnet" reads are one snapshot-row seek
+    # instead of a GROUP BY rescan of the raw table.
+    magnet_strike = Column(Float, default=0.0)
+    magnet_strength = Column(Float, default=0.0)
 
     collection_run = relationship("CollectionRun", back_populates="snapshots")
     raw_options = relationship("RawOptionGreek", back_populates="snapshot", cascade="all, delete-orphan")
@@ -83,11 +88,56 @@ class RawOptionGreek(Base):
     __table_args__ = (
         Index("idx_raw_symbol_time", "symbol", "timestamp"),
         Index("idx_raw_snapshot_strike", "snapshot_id", "strike_price"),
+        # Covers the per-snapshot strike/GEX aggregations (gamma levels,
+        # profiles) so they run as index-only scans.
+        Index("idx_raw_snapshot_strike_gex", "snapshot_id", "strike_price", "gex_value"),
     )
 
 
-def get_engine():
-    return create_engine(DB_CONNECTION_STR)
+def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+    """Tune each SQLite connection for the collector/dashboard workload.
+
+    WAL lets the dashboard read while the collector commits, NORMAL
+    synchronous halves the fsync count per commit, and the cache/mmap
+    settings keep hot pages out of repeated read syscalls.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB mmap window
+    cursor.close()
+
+
+def get_engine(shared_connection: bool = False):
+    """Create the SQLite engine.
+
+    With shared_connection=True the engine keeps a single reused DBAPI
+    connection (StaticPool), which keeps the SQLite page cache warm
+    across calls. Suited to read-mostly consumers like the dashboard.
+    """
+    kwargs = {}
+    if shared_connection:
+        kwargs["poolclass"] = StaticPool
+        kwargs["connect_args"] = {"check_same_thread": False, "timeout": 30}
+    engine = create_engine(DB_CONNECTION_STR, **kwargs)
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+def _ensure_columns(engine, table: str, columns: dict[str, str]) -> None:
+    """Adds any missing columns to an existing table.
+
+    create_all only creates missing tables, so columns added to a model
+    after a database was built need this lightweight ALTER TABLE pass.
+    """
+    with engine.connect() as conn:
+        existing = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")}
+        for name, ddl in columns.items():
+            if name not in existing:
+                conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}")
+        conn.commit()
 
 
 def get_session_factory(engine=None):
@@ -143,17 +193,26 @@ def reset_database(db_path: Path = DB_PATH) -> Path | None:
     return backup_path
 
 
-def initialize_database(reset_old_schema: bool = True, allow_legacy_on_lock: bool = False):
+def initialize_database(
+    reset_old_schema: bool = True,
+    allow_legacy_on_lock: bool = False,
+    shared_connection: bool = False,
+):
     if reset_old_schema and not schema_is_current(DB_PATH):
         try:
             backup_database(DB_PATH)
         except PermissionError:
             if allow_legacy_on_lock:
-                return get_engine()
+                return get_engine(shared_connection=shared_connection)
             raise
 
-    engine = get_engine()
+    engine = get_engine(shared_connection=shared_connection)
     Base.metadata.create_all(engine)
+    _ensure_columns(
+        engine,
+        "gex_snapshots",
+        {"magnet_strike": "FLOAT DEFAULT 0.0", "magnet_strength": "FLOAT DEFAULT 0.0"},
+    )
     return engine
 
 
@@ -7,11 +7,15 @@ Attributes:
     NT_PORT (int): Default TCP port (5010) for NinjaTrader connections.
 """
 
+import collections
+import re
 import socket
-import json
 import logging
+import selectors
 import threading
 import time
+
+import orjson
 from datetime import datetime
 from typing import Optional, List
 
@@ -26,20 +30,24 @@ class NinjaBroadcaster:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(NinjaBroadcaster, cls).__new__(cls)
-            cls._instance.clients = []
+            cls._instance.clients = set()
+            # Per-client outgoing message queue drained by the writer thread.
+            cls._instance.pending = {}
             cls._instance.lock = threading.Lock()
             cls._instance.running = False
             cls._instance.server_socket = None
         return cls._instance
 
     def start_server(self, port=NT_PORT):
-        """Starts the TCP Server in a background thread."""
+        """Starts the TCP Server and writer thread in the background."""
         if self.running:
             return
-            
+
         self.running = True
         thread = threading.Thread(target=self._server_loop, args=(port,), daemon=True)
         thread.start()
+        writer = threading.Thread(target=self._writer_loop, daemon=True)
+        writer.start()
         print(f"[NinjaBroadcaster] Server started on port {port}")
         logger.info(f"NinjaBroadcaster Server started on port {port}")
 
@@ -52,10 +60,12 @@ class NinjaBroadcaster:
             while self.running:
                 try:
                     client_sock, addr = self.server_socket.accept()
+                    client_sock.setblocking(False)
                     print(f"[NinjaBroadcaster] Client connected: {addr}")
-                    
+
                     with self.lock:
-                        self.clients.append(client_sock)
+                        self.clients.add(client_sock)
+                        self.pending[client_sock] = collections.deque()
                 except Exception as e:
                     if self.running:
                         logger.error(f"Accept error: {e}")
@@ -63,43 +73,93 @@ class NinjaBroadcaster:
         except Exception as e:
             logger.critical(f"Server loop failed: {e}")
 
+    def _drop_client(self, client) -> None:
+        """Removes a client from membership and closes its socket."""
+        with self.lock:
+            self.pending.pop(client, None)
+            self.clients.discard(client)
+        try:
+            client.close()
+        except Exception:
+            pass
+
+    def _writer_loop(self):
+        """Drains per-client send queues with non-blocking writes.
+
+        A slow NinjaTrader chart only delays its own queue; other clients
+        and the accept loop never wait on its socket.
+        """
+        sel = selectors.DefaultSelector()
+        registered = set()
+        while self.running:
+            with self.lock:
+                waiting = [c for c, q in self.pending.items() if q and c not in registered]
+            for client in waiting:
+                try:
+                    sel.register(client, selectors.EVENT_WRITE)
+                    registered.add(client)
+                except (ValueError, OSError):
+                    self._drop_client(client)
+
+            if not registered:
+                time.sleep(0.05)
+                continue
+
+            dead = []
+            for key, _mask in sel.select(timeout=0.25):
+                client = key.fileobj
+                sendq = self.pending.get(client)
+                try:
+                    while sendq:
+                        sent = client.send(sendq[0])
+                        if sent < len(sendq[0]):
+                            # memoryview slice: advance without copying the
+                            # unsent tail of a partially written message.
+                            sendq[0] = memoryview(sendq[0])[sent:]
+                            break
+                        sendq.popleft()
+                except BlockingIOError:
+                    continue
+                except Exception as e:
+                    logger.warning(f"Client disconnected during send: {e}")
+                    dead.append(client)
+                    continue
+                if not sendq:
+                    sel.unregister(client)
+                    registered.discard(client)
+
+            for client in dead:
+                sel.unregister(client)
+                registered.discard(client)
+                self._drop_client(client)
+
     def broadcast(self, payload: dict) -> None:
-        """Sends JSON data to all connected NinjaTrader clients.
+        """Queues JSON data for all connected NinjaTrader clients.
 
-        Iterates through the list of active client sockets and sends the
-        newline-delimited JSON message. Handles disconnection cleanup automatically.
+        Encodes the newline-delimited JSON message once and appends it to
+        each client's send queue; the writer thread drains the queues with
+        non-blocking sends, so a stalled chart cannot block the caller or
+        the other clients.
 
         Args:
             payload: A dictionary containing the regime or market data to send.
         """
+        # orjson emits bytes directly; no str round-trip or .encode pass.
+        encoded_msg = orjson.dumps(payload) + b"\n"
+
         with self.lock:
-            if not self.clients:
+            if not self.pending:
                 # No clients connected
                 return
+            for sendq in self.pending.values():
+                sendq.append(encoded_msg)
+                # Cap the backlog so a stalled chart bounds memory; when it
+                # recovers it resumes from the most recent updates.
+                while len(sendq) > 64:
+                    sendq.popleft()
+            count = len(self.pending)
 
-        json_msg = json.dumps(payload) + "\n"
-        encoded_msg = json_msg.encode('utf-8')
-        
-        to_remove = []
-        
-        with self.lock:
-            for client in self.clients:
-                try:
-                    client.sendall(encoded_msg)
-                except Exception as e:
-                    logger.warning(f"Client disconnected during send: {e}")
-                    to_remove.append(client)
-            
-            # Clean up disconnected clients
-            for dead_client in to_remove:
-                if dead_client in self.clients:
-                    self.clients.remove(dead_client)
-                    try:
-                        dead_client.close()
-                    except:
-                        pass
-                        
-        print(f"[NinjaBroadcaster] Sent update to {len(self.clients)} charts.")
+        print(f"[NinjaBroadcaster] Queued update for {count} charts.")
 
 # Global instance
 broadcaster = NinjaBroadcaster()
@@ -115,12 +175,15 @@ REGIME_CODES = {
     "CRASH / FLUSH": 4,
 }
 
+# Compiled once: the icon/qualifier prefixes stripped from compass labels,
+# and the known regime names for code extraction.
+_LABEL_CLEAN_RE = re.compile("🟢 |🟡 |🔴 |⚪ |WEAK |LOW CONFIDENCE ")
+_REGIME_CODE_RE = re.compile("|".join(re.escape(key) for key in REGIME_CODES))
+
 def extract_regime_code(label: str) -> int:
     """Extract numeric regime code from label string."""
-    for key, code in REGIME_CODES.items():
-        if key in label.upper():
-            return code
-    return 0  # Unknown
+    match = _REGIME_CODE_RE.search(label.upper())
+    return REGIME_CODES[match.group(0)] if match else 0  # 0 = Unknown
 
 def send_regime_update(overview_data: dict, port: int = NT_PORT) -> bool:
     """Broadcasts a full market regime update to connected NinjaTrader clients.
@@ -140,11 +203,14 @@ def send_regime_update(overview_data: dict, port: int = NT_PORT) -> bool:
     try:
         compass = overview_data.get("compass", {})
         components = overview_data.get("components", [])
-        
-        # Extract data for each important symbol
-        spy_data = next((c for c in components if c.get("symbol") == "SPY"), {})
-        spx_data = next((c for c in components if c.get("symbol") == "SPX"), {})
-        ndx_data = next((c for c in components if c.get("symbol") == "NDX"), {})
+
+        # Extract data for each important symbol. Prefer the symbol-keyed
+        # dict stashed by get_market_overview; fall back to building one
+        # for callers that only supply the component list.
+        by_sym = overview_data.get("_components_by_symbol") or {c.get("symbol"): c for c in components}
+        spy_data = by_sym.get("SPY", {})
+        spx_data = by_sym.get("SPX", {})
+        ndx_data = by_sym.get("NDX", {})
         
         label = compass.get("label", "NEUTRAL")
         confidence = compass.get("confidence_label")
@@ -155,7 +221,7 @@ def send_regime_update(overview_data: dict, port: int = NT_PORT) -> bool:
         payload = {
             "type": "REGIME_UPDATE",
             "timestamp": datetime.now().isoformat(),
-            "regime": label.replace("🟢 ", "").replace("🟡 ", "").replace("🔴 ", "").replace("⚪ ", "").replace("WEAK ", "").strip(),
+            "regime": _LABEL_CLEAN_RE.sub("", label).strip(),
             "regime_code": extract_regime_code(label),
             "confidence": confidence,
             "confidence_score": round(compass.get("confidence", 0), 4),
@@ -176,8 +242,7 @@ def send_regime_update(overview_data: dict, port: int = NT_PORT) -> bool:
             "gamma_levels_ndx": overview_data.get("gamma_levels", {}).get("NDX", []),
             "gamma_levels_spx": overview_data.get("gamma_levels", {}).get("SPX", []),
         }
-        payload["regime"] = payload["regime"].replace("LOW CONFIDENCE ", "").strip()
-        
+
         # Use simple global broadcaster to send
         broadcaster.broadcast(payload)
         return True
@@ -1,17 +1,24 @@
 import argparse
-import json
 import logging
 import os
 import re
 import socket
+import struct
 import sys
+import threading
 import time
 from contextlib import contextmanager
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+import orjson
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter, Retry
 from sqlalchemy import delete, func
 from sqlalchemy.orm import Session
 
@@ -25,6 +32,10 @@ from models import (
     reset_database,
 )
 
+# Built once at import; SQLAlchemy caches the compiled form per construct,
+# so reusing the same INSERT skips statement compilation on every symbol.
+_RAW_INSERT = RawOptionGreek.__table__.insert()
+
 DEFAULT_SETTINGS = {
     "refresh_interval": 180,
     "theme": "dark",
@@ -49,6 +60,18 @@ OrderInstrument = None
 PublicApiClient = None
 PublicApiClientConfiguration = None
 
+# Shared HTTP session for direct REST calls: keep-alive pooling across the
+# Greek batch chunks plus automatic backoff on transient failures.
+_HTTP = requests.Session()
+_HTTP.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+    ),
+)
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
@@ -62,18 +85,108 @@ class ConfigError(ValueError):
 
 
 class RateLimiter:
-    """Simple blocking rate limiter to respect API tokens."""
+    """Token-bucket rate limiter, safe to share across threads.
+
+    Refills on a monotonic clock so wall-clock jumps can't stall or flood
+    the API, allows short bursts up to the per-minute budget instead of a
+    rigid inter-request delay, and adapts when a response advertises the
+    remaining quota or asks for a back-off.
+    """
 
     def __init__(self, requests_per_minute: int):
-        self.delay = 60.0 / max(1, requests_per_minute)
-        self.last_call = 0.0
+        rpm = max(1, requests_per_minute)
+        self.rate = rpm / 60.0
+        self.capacity = float(rpm)
+        self.tokens = float(rpm)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill_locked(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
 
     def wait(self):
-        now = time.time()
-        elapsed = now - self.last_call
-        if elapsed < self.delay:
-            time.sleep(self.delay - elapsed)
-        self.last_call = time.time()
+        while True:
+            with self.lock:
+                self._refill_locked(time.monotonic())
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                needed = (1.0 - self.tokens) / self.rate
+            time.sleep(needed)
+
+    def observe(self, response):
+        """Adapt the bucket to rate-limit feedback on an HTTP response."""
+        headers = getattr(response, "headers", None) or {}
+        remaining = (
+            headers.get("x-ratelimit-remaining-requests")
+            or headers.get("x-ratelimit-remaining")
+            or headers.get("X-RateLimit-Remaining")
+        )
+        if remaining is not None:
+            try:
+                remaining = float(remaining)
+            except (TypeError, ValueError):
+                remaining = None
+        if remaining is not None:
+            with self.lock:
+                self.tokens = min(self.tokens, remaining)
+
+        if getattr(response, "status_code", None) == 429:
+            retry_after = headers.get("retry-after") or headers.get("Retry-After")
+            try:
+                delay = max(0.0, float(retry_after))
+            except (TypeError, ValueError):
+                delay = 1.0
+            logger.warning("API rate limit hit; backing off %.1fs", delay)
+            time.sleep(delay)
+
+
+class ConcurrencyController:
+    """AIMD gate for concurrent per-symbol collection.
+
+    Additive increase (+0.5 slots) while tasks finish under the latency
+    target, multiplicative decrease (halve) when one fails or runs long —
+    the classic AIMD feedback loop, applied to API-bound workers so the
+    collector probes for parallelism without overrunning the quota.
+    """
+
+    def __init__(self, c_min: float = 1.0, c_max: float = 8.0, latency_target: float = 30.0):
+        self.c = float(c_min)
+        self.c_min = float(c_min)
+        self.c_max = float(c_max)
+        self.latency_target = latency_target
+        self.ema_latency = 0.0
+        self.in_flight = 0
+        self.cond = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        with self.cond:
+            while self.in_flight >= int(self.c):
+                self.cond.wait(timeout=0.5)
+            self.in_flight += 1
+
+        start = time.monotonic()
+        failed = False
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            latency = time.monotonic() - start
+            with self.cond:
+                self.in_flight -= 1
+                if self.ema_latency == 0.0:
+                    self.ema_latency = latency
+                else:
+                    self.ema_latency = 0.7 * self.ema_latency + 0.3 * latency
+                if failed or self.ema_latency > self.latency_target:
+                    self.c = max(self.c_min, self.c * 0.5)
+                else:
+                    self.c = min(self.c_max, self.c + 0.5)
+                self.cond.notify_all()
 
 
 def load_public_sdk():
@@ -133,12 +246,12 @@ def collector_lock():
 def load_settings(path: str = "settings.json") -> dict:
     settings = DEFAULT_SETTINGS.copy()
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            user_settings = json.load(f)
+        with open(path, "rb") as f:
+            user_settings = orjson.loads(f.read())
         settings.update(user_settings)
     except FileNotFoundError:
         logger.warning("settings.json not found; using defaults.")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ConfigError(f"settings.json is invalid JSON: {e}") from e
 
     if not isinstance(settings.get("symbols"), list) or not settings["symbols"]:
@@ -179,15 +292,46 @@ def load_runtime_config() -> dict:
 
 
 def json_list(values: list[str]) -> str:
-    return json.dumps(values)
+    return orjson.dumps(values).decode()
+
+
+# Persistent connection to the dashboard's event server, shared by all
+# collector threads. Each per-symbol event then costs one send instead of
+# a TCP handshake plus teardown; rebuilt lazily if the dashboard restarts.
+_EVENT_SOCK = None
+_EVENT_SOCK_PORT = None
+_event_lock = threading.Lock()
+
+
+def _connect_event_socket(port: int) -> socket.socket:
+    s = socket.create_connection(("127.0.0.1", port), timeout=5)
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return s
 
 
 def send_event_to_backend(payload, port=5005):
+    global _EVENT_SOCK, _EVENT_SOCK_PORT
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(5)
-            s.connect(("127.0.0.1", port))
-            s.sendall(json.dumps(payload).encode("utf-8"))
+        message = orjson.dumps(payload)
+        # Length-prefixed frame matching the event server's protocol.
+        frame = struct.pack(">I", len(message)) + message
+
+        with _event_lock:
+            for attempt in (0, 1):
+                if _EVENT_SOCK is None or _EVENT_SOCK_PORT != port:
+                    _EVENT_SOCK = _connect_event_socket(port)
+                    _EVENT_SOCK_PORT = port
+                try:
+                    _EVENT_SOCK.sendall(frame)
+                    return
+                except (BrokenPipeError, ConnectionResetError, OSError):
+                    try:
+                        _EVENT_SOCK.close()
+                    except OSError:
+                        pass
+                    _EVENT_SOCK = None
+                    if attempt:
+                        raise
     except Exception as e:
         logger.debug("Failed to send event to backend: %s", e)
 
@@ -215,11 +359,57 @@ def get_val(obj: Any, keys: list[str], default=None):
     return default
 
 
+def _pick_accessor(sample, keys: list[str], default=None):
+    """Bind a fast accessor for the first of `keys` present on `sample`.
+
+    The returned closure is specialized to dict-subscript or attribute
+    access, so hot loops pay one C-level lookup per call instead of
+    get_val's candidate-key probing. Items that deviate from the sampled
+    schema fall back to get_val transparently.
+    """
+    if isinstance(sample, dict):
+        for key in keys:
+            if key in sample:
+                def acc(obj, _key=key, _keys=keys, _d=default):
+                    try:
+                        return obj[_key]
+                    except (KeyError, TypeError):
+                        return get_val(obj, _keys, _d)
+                return acc
+    elif sample is not None:
+        for key in keys:
+            if getattr(sample, key, None) is not None:
+                def acc(obj, _key=key, _keys=keys, _d=default):
+                    val = getattr(obj, _key, None)
+                    return val if val is not None else get_val(obj, _keys, _d)
+                return acc
+    return lambda obj, _keys=keys, _d=default: get_val(obj, _keys, _d)
+
+
+# Bound accessor tuples keyed by (instrument type, chain row type). The
+# provider returns the same schema for a given instrument type across runs,
+# so the candidate-key probing happens once per schema, not per collection.
+_ACCESSOR_CACHE: dict[tuple, tuple] = {}
+
+
+# Fallback for symbols that deviate from the fixed OSI tail layout.
+_OSI_RE = re.compile(r"(\d{6})([CP])(\d{8})$")
+
+
 def parse_osi_from_symbol(osi_str: str):
     if not osi_str:
         return 0.0, None
+
+    # OSI tails are fixed-width: 6-digit date, C/P, 8-digit strike.
+    # Slicing + isdigit beats the regex engine on these short strings.
+    if len(osi_str) >= 15:
+        tail = osi_str[-15:]
+        cp = tail[6]
+        if (cp == "C" or cp == "P") and tail[:6].isdigit() and tail[7:].isdigit():
+            return int(tail[7:]) / 1000.0, "CALL" if cp == "C" else "PUT"
+
     try:
-        match = re.search(r"(\d{6})([CP])(\d{8})$", osi_str)
+        match = _OSI_RE.search(osi_str)
         if match:
             otype = "CALL" if match.group(2) == "C" else "PUT"
             strike = float(match.group(3)) / 1000.0
@@ -229,27 +419,30 @@ def parse_osi_from_symbol(osi_str: str):
     return 0.0, None
 
 
-def extract_all_options(response_obj) -> list:
+def _extract_specific_keys(response_obj) -> Optional[list]:
     all_options = []
     found_specific = False
-
     for key in ["calls", "puts", "options"]:
         val = get_val(response_obj, [key])
         if isinstance(val, list):
             all_options.extend(val)
             found_specific = True
+    return all_options if found_specific else None
+
 
-    if found_specific:
-        return all_options
+def _extract_self_list(response_obj) -> Optional[list]:
+    return response_obj if isinstance(response_obj, list) else None
 
-    if isinstance(response_obj, list):
-        return response_obj
 
+def _extract_container_attr(response_obj) -> Optional[list]:
     for attr in ["items", "data", "contracts", "chain", "instrument", "quotes"]:
         val = get_val(response_obj, [attr])
         if isinstance(val, list):
             return val
+    return None
+
 
+def _extract_from_vars(response_obj) -> Optional[list]:
     if hasattr(response_obj, "__dict__"):
         temp_list = []
         for v in vars(response_obj).values():
@@ -257,35 +450,65 @@ def extract_all_options(response_obj) -> list:
                 temp_list.extend(v)
         if temp_list:
             return temp_list
+    return None
+
+
+_EXTRACT_STRATEGIES = (
+    _extract_specific_keys,
+    _extract_self_list,
+    _extract_container_attr,
+    _extract_from_vars,
+)
+
+# Which strategy matched, keyed by response type name. The SDK returns the
+# same shape on every call, so the probe chain only needs to run once.
+_EXTRACT_CACHE: dict[str, Any] = {}
+
+
+def extract_all_options(response_obj) -> list:
+    cache_key = type(response_obj).__name__
+    cached = _EXTRACT_CACHE.get(cache_key)
+    if cached is not None:
+        result = cached(response_obj)
+        if result is not None:
+            return result
+        # Shape changed under the same type name; re-detect below.
+        _EXTRACT_CACHE.pop(cache_key, None)
+
+    for strategy in _EXTRACT_STRATEGIES:
+        result = strategy(response_obj)
+        if result is not None:
+            _EXTRACT_CACHE[cache_key] = strategy
+            return result
 
     return []
 
 
-def calculate_flip_point(gex_by_strike: dict) -> float:
-    strikes = sorted(gex_by_strike.keys())
-    if not strikes:
-        return 0.0
+def calculate_flip_point(strikes_sorted, gex_sorted) -> float:
+    """Interpolated zero crossing of cumulative GEX over strike-sorted arrays.
 
-    running_total = 0.0
-    prev_total = 0.0
-    prev_strike = strikes[0]
+    Same semantics as the old per-strike loop (first sign change wins,
+    linear interpolation between the bracketing strikes), computed with
+    one cumsum and a vectorized sign-change scan.
+    """
+    if len(strikes_sorted) == 0:
+        return 0.0
 
-    for i, strike in enumerate(strikes):
-        running_total += gex_by_strike[strike]
-        if i == 0:
-            prev_total = running_total
-            prev_strike = strike
-            continue
-        if (prev_total < 0 <= running_total) or (prev_total > 0 >= running_total):
-            span = running_total - prev_total
-            if span == 0:
-                return strike
-            ratio = abs(prev_total) / abs(span)
-            return prev_strike + ((strike - prev_strike) * ratio)
-        prev_total = running_total
-        prev_strike = strike
+    cum = np.cumsum(gex_sorted)
+    prev, curr = cum[:-1], cum[1:]
+    crossings = np.flatnonzero(((prev < 0) & (curr >= 0)) | ((prev > 0) & (curr <= 0)))
+    if crossings.size == 0:
+        return 0.0
 
-    return 0.0
+    i = int(crossings[0])
+    prev_total = float(cum[i])
+    span = float(cum[i + 1]) - prev_total
+    prev_strike = float(strikes_sorted[i])
+    strike = float(strikes_sorted[i + 1])
+    if span == 0:
+        return strike
+    ratio = abs(prev_total) / abs(span)
+    return prev_strike + ((strike - prev_strike) * ratio)
 
 
 def calculate_gex_slope(spot, profile_data):
@@ -376,8 +599,10 @@ def get_option_greeks_batch(client, osi_symbols: list[str], account_id: str, rat
 
     try:
         api_client = client.api_client
-        session = api_client.session
         base_url = api_client.base_url
+        # Auth lives on the SDK session's headers; reuse them on the pooled
+        # retrying session so every chunk shares one keep-alive connection.
+        auth_headers = dict(api_client.session.headers)
     except AttributeError:
         logger.error("Could not access internal client session for batch request.")
         return results
@@ -390,9 +615,11 @@ def get_option_greeks_batch(client, osi_symbols: list[str], account_id: str, rat
         rate_limiter.wait()
 
         try:
-            resp = session.get(url, params={"osiSymbols": chunk})
+            resp = _HTTP.get(url, params={"osiSymbols": chunk}, headers=auth_headers, timeout=(3.05, 10))
+            rate_limiter.observe(resp)
             if resp.status_code == 200:
-                data = resp.json()
+                # Skip requests' encoding detection; orjson parses the raw bytes.
+                data = orjson.loads(resp.content)
                 items = data.get("greeks", []) if isinstance(data, dict) else data
                 for item in items:
                     sym = item.get("symbol")
@@ -438,19 +665,46 @@ def process_symbol(client, session: Session, run: CollectionRun, symbol: str, co
         )
         options_list = extract_all_options(client.get_option_chain(req))
 
-        relevant_options = []
+        # Schema-specialized accessors, cached per (instrument type, row
+        # type): every contract in a response shares the same shape, and the
+        # same schema recurs across runs.
+        sample = options_list[0] if options_list else None
+        cache_key = (itype, type(sample))
+        accessors = _ACCESSOR_CACHE.get(cache_key)
+        if accessors is None:
+            inst_acc = _pick_accessor(sample, ["instrument"])
+            inst_sample = inst_acc(sample) if sample is not None else None
+            accessors = (
+                inst_acc,
+                _pick_accessor(inst_sample, ["strike_price", "strikePrice", "strike"], 0),
+                _pick_accessor(inst_sample, ["symbol", "ticker", "osi_symbol"]),
+                _pick_accessor(inst_sample, ["option_type", "optionType"], ""),
+                _pick_accessor(sample, ["open_interest", "openInterest"], 0),
+            )
+            if sample is not None:
+                _ACCESSOR_CACHE[cache_key] = accessors
+        inst_acc, strike_acc, osi_acc, type_acc, oi_acc = accessors
+
         upper_bound = spot_price * (1 + STRIKE_RANGE_PCT)
         lower_bound = spot_price * (1 - STRIKE_RANGE_PCT)
         logger.info("Filtering %s: Spot %.2f | Range %.2f - %.2f", symbol, spot_price, lower_bound, upper_bound)
 
+        # Extract every strike once, then select the near-the-money window
+        # with a single vectorized mask instead of per-row bound compares.
+        strikes_all = []
+        osi_all = []
         for opt in options_list:
-            instrument = get_val(opt, ["instrument"])
-            strike = float(get_val(instrument, ["strike_price", "strikePrice", "strike"], 0))
-            osi = get_val(instrument, ["symbol", "ticker", "osi_symbol"]) or get_val(opt, ["symbol", "ticker"])
+            instrument = inst_acc(opt)
+            strike = float(strike_acc(instrument) or 0)
+            osi = osi_acc(instrument) or get_val(opt, ["symbol", "ticker"])
             if strike == 0:
                 strike, _ = parse_osi_from_symbol(osi)
-            if lower_bound <= strike <= upper_bound:
-                relevant_options.append((opt, strike, osi))
+            strikes_all.append(strike)
+            osi_all.append(osi)
+
+        strike_vec = np.asarray(strikes_all, dtype=np.float64)
+        in_range = np.flatnonzero((strike_vec >= lower_bound) & (strike_vec <= upper_bound))
+        relevant_options = [(options_list[i], strikes_all[i], osi_all[i]) for i in in_range]
 
         if not relevant_options:
             return {"symbol": symbol, "status": "failed", "message": "No valid near-the-money contracts"}
@@ -459,25 +713,20 @@ def process_symbol(client, session: Session, run: CollectionRun, symbol: str, co
         logger.info("Fetching Greeks for %s contracts using batch API...", len(all_osi))
         greeks_map = get_option_greeks_batch(client, all_osi, config["account_id"], rate_limiter)
 
-        total_net_gex = 0.0
-        total_call_gex = 0.0
-        total_put_gex = 0.0
-        total_gamma_sum = 0.0
-        total_theta_sum = 0.0
-        effective_gex = 0.0
-        gex_by_strike = {}
-        raw_rows = []
         eff_upper = spot_price * 1.02
         eff_lower = spot_price * 0.98
 
+        # One Python pass for the string/lookup work (open interest, option
+        # type, Greeks); the numeric math below runs vectorized over arrays.
+        contracts = []
         for opt, strike, osi in relevant_options:
             try:
-                instrument = get_val(opt, ["instrument"])
-                oi = int(get_val(opt, ["open_interest", "openInterest"], 0) or 0)
+                instrument = inst_acc(opt)
+                oi = int(oi_acc(opt) or 0)
                 if oi == 0:
                     continue
 
-                otype_raw = get_val(instrument, ["option_type", "optionType"], "")
+                otype_raw = type_acc(instrument)
                 if not otype_raw or str(otype_raw).upper() == "OPTION":
                     _, parsed_type = parse_osi_from_symbol(osi)
                     otype = parsed_type
@@ -487,47 +736,63 @@ def process_symbol(client, session: Session, run: CollectionRun, symbol: str, co
                     otype = "UNKNOWN"
 
                 greek_data = greeks_map.get(osi, {})
-                gamma = float(greek_data.get("gamma") or 0)
-                delta = float(greek_data.get("delta") or 0)
-                theta = float(greek_data.get("theta") or 0)
-
-                total_gamma_sum += gamma * oi * 100
-                total_theta_sum += theta * oi * 100
-
-                # Dollar gamma exposure for a 1% underlying move.
-                raw_gex = gamma * oi * 100 * spot_price * spot_price * 0.01
-                if "PUT" in otype:
-                    raw_gex *= -1
-                    total_put_gex += raw_gex
-                else:
-                    total_call_gex += raw_gex
-
-                total_net_gex += raw_gex
-                if eff_lower <= strike <= eff_upper:
-                    effective_gex += raw_gex
-                gex_by_strike[strike] = gex_by_strike.get(strike, 0.0) + raw_gex
-
-                raw_rows.append(
-                    {
-                        "timestamp": timestamp,
-                        "symbol": symbol,
-                        "expiration_date": expiration_date,
-                        "osi_symbol": osi,
-                        "strike_price": strike,
-                        "option_type": otype,
-                        "delta": delta,
-                        "gamma": gamma,
-                        "open_interest": oi,
-                        "underlying_price": spot_price,
-                        "gex_value": raw_gex,
-                    }
+                contracts.append(
+                    (
+                        strike,
+                        osi,
+                        otype,
+                        oi,
+                        float(greek_data.get("gamma") or 0),
+                        float(greek_data.get("delta") or 0),
+                        float(greek_data.get("theta") or 0),
+                    )
                 )
             except Exception as e:
                 logger.error("Error processing %s: %s", osi, e)
 
-        if not raw_rows:
+        if not contracts:
             return {"symbol": symbol, "status": "failed", "message": "No contracts with open interest and Greeks"}
 
+        strike_arr = np.array([c[0] for c in contracts], dtype=np.float64)
+        oi_arr = np.array([c[3] for c in contracts], dtype=np.float64)
+        gamma_arr = np.array([c[4] for c in contracts], dtype=np.float64)
+        theta_arr = np.array([c[6] for c in contracts], dtype=np.float64)
+        is_put = np.array(["PUT" in c[2] for c in contracts], dtype=bool)
+
+        total_gamma_sum = float((gamma_arr * oi_arr).sum() * 100)
+        total_theta_sum = float((theta_arr * oi_arr).sum() * 100)
+
+        # Dollar gamma exposure for a 1% underlying move; puts flip sign.
+        raw_gex = gamma_arr * oi_arr * 100.0 * spot_price * spot_price * 0.01
+        raw_gex[is_put] *= -1.0
+
+        total_net_gex = float(raw_gex.sum())
+        total_put_gex = float(raw_gex[is_put].sum())
+        total_call_gex = float(raw_gex[~is_put].sum())
+        effective_gex = float(raw_gex[(strike_arr >= eff_lower) & (strike_arr <= eff_upper)].sum())
+
+        # Per-strike aggregation without dict hashing per contract.
+        unique_strikes, inverse = np.unique(strike_arr, return_inverse=True)
+        strike_gex = np.bincount(inverse, weights=raw_gex)
+        gex_by_strike = dict(zip(unique_strikes.tolist(), strike_gex.tolist()))
+
+        raw_rows = [
+            {
+                "timestamp": timestamp,
+                "symbol": symbol,
+                "expiration_date": expiration_date,
+                "osi_symbol": osi,
+                "strike_price": strike,
+                "option_type": otype,
+                "delta": delta,
+                "gamma": gamma,
+                "open_interest": oi,
+                "underlying_price": spot_price,
+                "gex_value": gex,
+            }
+            for (strike, osi, otype, oi, gamma, delta, _theta), gex in zip(contracts, raw_gex.tolist())
+        ]
+
         prev_snap = (
             session.query(GexSnapshot)
             .filter(GexSnapshot.symbol == symbol)
@@ -535,25 +800,21 @@ def process_symbol(client, session: Session, run: CollectionRun, symbol: str, co
             .first()
         )
 
-        prev_magnet_strike = 0
-        if prev_snap:
-            prev_magnet_row = (
-                session.query(RawOptionGreek.strike_price, func.sum(RawOptionGreek.gex_value).label("net_gex"))
-                .filter(RawOptionGreek.snapshot_id == prev_snap.id)
-                .group_by(RawOptionGreek.strike_price)
-                .order_by(func.abs(func.sum(RawOptionGreek.gex_value)).desc())
-                .first()
-            )
-            if prev_magnet_row:
-                prev_magnet_strike = prev_magnet_row.strike_price
+        # The magnet is persisted on each snapshot, so the previous value is
+        # already on prev_snap — no GROUP BY rescan of the raw table.
+        prev_magnet_strike = (prev_snap.magnet_strike or 0) if prev_snap else 0
 
-        call_rows = [r for r in raw_rows if "CALL" in r["option_type"]]
-        put_rows = [r for r in raw_rows if "PUT" in r["option_type"]]
-        max_call_gex_strike = max(call_rows, key=lambda x: x["gex_value"])["strike_price"] if call_rows else 0
-        max_put_gex_strike = min(put_rows, key=lambda x: x["gex_value"])["strike_price"] if put_rows else 0
+        # Extrema straight from the vectorized arrays; no per-side row scans.
+        call_gex, put_gex = raw_gex[~is_put], raw_gex[is_put]
+        max_call_gex_strike = float(strike_arr[~is_put][np.argmax(call_gex)]) if call_gex.size else 0
+        max_put_gex_strike = float(strike_arr[is_put][np.argmin(put_gex)]) if put_gex.size else 0
 
-        magnet_strike = max(gex_by_strike, key=lambda s: abs(gex_by_strike[s])) if gex_by_strike else 0
-        magnet_strength = gex_by_strike.get(magnet_strike, 0)
+        if strike_gex.size:
+            magnet_idx = int(np.argmax(np.abs(strike_gex)))
+            magnet_strike = float(unique_strikes[magnet_idx])
+            magnet_strength = float(strike_gex[magnet_idx])
+        else:
+            magnet_strike = magnet_strength = 0
 
         snapshot = GexSnapshot(
             collection_run_id=run.id,
@@ -565,16 +826,22 @@ def process_symbol(client, session: Session, run: CollectionRun, symbol: str, co
             total_put_gex=total_put_gex,
             max_call_gex_strike=max_call_gex_strike,
             max_put_gex_strike=max_put_gex_strike,
-            flip_strike=calculate_flip_point(gex_by_strike),
+            flip_strike=calculate_flip_point(unique_strikes, strike_gex),
             regime="Sentiment",
             effective_gex=effective_gex,
             total_gamma=total_gamma_sum,
             total_theta=total_theta_sum,
+            magnet_strike=magnet_strike,
+            magnet_strength=magnet_strength,
         )
         session.add(snapshot)
         session.flush()
 
-        session.bulk_save_objects([RawOptionGreek(snapshot_id=snapshot.id, **row) for row in raw_rows])
+        # Core executemany: no per-row ORM instances or identity bookkeeping.
+        session.execute(
+            _RAW_INSERT,
+            [{**row, "snapshot_id": snapshot.id} for row in raw_rows],
+        )
         session.commit()
 
         logger.info("Saved %s records for %s. Net GEX: $%,.2f", len(raw_rows), symbol, total_net_gex)
@@ -616,6 +883,26 @@ def latest_snapshot(session: Session, symbol: str):
     )
 
 
+def latest_snapshots(session: Session, symbols: list[str]) -> dict:
+    """Latest snapshot per symbol in one query instead of one per symbol.
+
+    The MAX(timestamp) subquery and the join both ride the
+    (symbol, timestamp) composite index.
+    """
+    latest_ts = (
+        session.query(GexSnapshot.symbol.label("symbol"), func.max(GexSnapshot.timestamp).label("ts"))
+        .filter(GexSnapshot.symbol.in_(symbols))
+        .group_by(GexSnapshot.symbol)
+        .subquery()
+    )
+    rows = (
+        session.query(GexSnapshot)
+        .join(latest_ts, (GexSnapshot.symbol == latest_ts.c.symbol) & (GexSnapshot.timestamp == latest_ts.c.ts))
+        .all()
+    )
+    return {snap.symbol: snap for snap in rows}
+
+
 def build_overview_data(session: Session, settings: dict) -> dict:
     weights = settings.get("weights", {"SPY": 1.0})
     overview_data = {
@@ -628,8 +915,11 @@ def build_overview_data(session: Session, settings: dict) -> dict:
     weighted_trend_score = 0
     total_weight = 0
 
+    # One window over all symbols both loops below need.
+    latest = latest_snapshots(session, list(weights) + ["NDX", "SPX"])
+
     for symbol, weight in weights.items():
-        snap = latest_snapshot(session, symbol)
+        snap = latest.get(symbol)
         if not snap:
             continue
 
@@ -662,7 +952,7 @@ def build_overview_data(session: Session, settings: dict) -> dict:
         overview_data["compass"].update({"x_score": final_vol, "y_score": final_trend, "label": label})
 
     for idx_symbol in ["NDX", "SPX"]:
-        idx_snap = latest_snapshot(session, idx_symbol)
+        idx_snap = latest.get(idx_symbol)
         if not idx_snap:
             continue
 
@@ -677,22 +967,18 @@ def build_overview_data(session: Session, settings: dict) -> dict:
             }
         )
 
-        levels_below = (
-            session.query(RawOptionGreek.strike_price, func.sum(RawOptionGreek.gex_value).label("net_gex"))
-            .filter(RawOptionGreek.snapshot_id == idx_snap.id, RawOptionGreek.strike_price < idx_snap.spot_price)
-            .group_by(RawOptionGreek.strike_price)
-            .order_by(func.abs(func.sum(RawOptionGreek.gex_value)).desc())
-            .limit(5)
-            .all()
-        )
-        levels_above = (
+        # One aggregation over the snapshot; the above/below-spot split and
+        # top-5 picks happen in Python on the small per-strike result.
+        level_rows = (
             session.query(RawOptionGreek.strike_price, func.sum(RawOptionGreek.gex_value).label("net_gex"))
-            .filter(RawOptionGreek.snapshot_id == idx_snap.id, RawOptionGreek.strike_price >= idx_snap.spot_price)
+            .filter(RawOptionGreek.snapshot_id == idx_snap.id)
             .group_by(RawOptionGreek.strike_price)
-            .order_by(func.abs(func.sum(RawOptionGreek.gex_value)).desc())
-            .limit(5)
             .all()
         )
+        spot = idx_snap.spot_price
+        by_strength = sorted(level_rows, key=lambda row: abs(row.net_gex), reverse=True)
+        levels_below = [row for row in by_strength if row.strike_price < spot][:5]
+        levels_above = [row for row in by_strength if row.strike_price >= spot][:5]
 
         for level in sorted(levels_below + levels_above, key=lambda row: row.strike_price):
             overview_data["gamma_levels"][idx_symbol].append(
@@ -750,9 +1036,35 @@ def run_collection_once() -> dict:
     try:
         client = get_client(config)
         rate_limiter = RateLimiter(config["api_rate_limit"])
+        controller = ConcurrencyController()
+
+        # Load run.id on this thread while the main session is quiet, so
+        # worker threads read a plain attribute instead of triggering a
+        # post-commit refresh on a session they don't own.
+        _ = run.id
+
+        def collect(symbol: str) -> dict:
+            # Sessions are not thread-safe; each worker opens its own.
+            with controller.slot():
+                worker_session = SessionLocal()
+                try:
+                    return process_symbol(client, worker_session, run, symbol, config, rate_limiter)
+                finally:
+                    worker_session.close()
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=int(controller.c_max), thread_name_prefix="collect") as pool:
+            futures = {pool.submit(collect, symbol): symbol for symbol in config["symbols"]}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    logger.exception("Worker failed for %s", symbol)
+                    results[symbol] = {"symbol": symbol, "status": "failed", "message": str(e)}
 
         for symbol in config["symbols"]:
-            result = process_symbol(client, session, run, symbol, config, rate_limiter)
+            result = results[symbol]
             if result["status"] == "saved":
                 saved.append(symbol)
             elif result["status"] == "skipped":
@@ -851,7 +1163,7 @@ if __name__ == "__main__":
 
     if args.once:
         result = main_once()
-        print(json.dumps(result))
+        print(orjson.dumps(result).decode())
         sys.exit(0 if result["ok"] else 1)
 
     try:
@@ -87,6 +87,24 @@ function switchView(viewName) {
     }
 }
 
+// The backend sends the profile in columnar form (one array per field) to
+// shrink the JSON payload; expand it back to row objects once here so the
+// chart and table code keeps consuming rows.
+function profileToRows(profile) {
+    if (!profile || Array.isArray(profile)) return profile || [];
+    const n = (profile.strike_price || []).length;
+    const rows = new Array(n);
+    for (let i = 0; i < n; i++) {
+        rows[i] = {
+            strike_price: profile.strike_price[i],
+            option_type: profile.option_type[i],
+            gex_value: profile.gex_value[i],
+            open_interest: profile.open_interest[i],
+        };
+    }
+    return rows;
+}
+
 async function loadSymbol() {
     const symbol = document.getElementById('symbolSelector').value;
     if (!symbol) return;
@@ -97,6 +115,7 @@ async function loadSymbol() {
         showToast("No Data", data.error, "info");
         return;
     }
+    data.profile = profileToRows(data.profile);
 
     cachedData = data;
     cachedSymbol = symbol;
@@ -417,7 +436,7 @@ async function manualRefresh() {
     if (result && result.ok === false) {
         showToast("Refresh Skipped", result.message || "Collector did not save new data.", "info");
     } else {
-        showToast("Refresh Complete", "Latest market data requested.", "info");
+        showToast("Refresh Started", "Latest market data requested.", "info");
     }
 
     await loadSymbol();
@@ -471,6 +490,7 @@ async function loadOverview() {
     if (selectedSymbol && (!symbolData || cachedSymbol !== selectedSymbol)) {
         symbolData = await eel.get_dashboard_data(selectedSymbol)();
         if (!symbolData.error) {
+            symbolData.profile = profileToRows(symbolData.profile);
             cachedData = symbolData;
             cachedSymbol = selectedSymbol;
         }
@@ -1295,6 +1315,11 @@ eel.expose(handle_backend_event);
 function handle_backend_event(event) {
     console.log("Backend Event Received:", event);
 
+    // Progress lines are chatty; keep them out of the notification panel.
+    if (event.type === 'REFRESH_PROGRESS') {
+        return;
+    }
+
     // 1. Add to Panel
     addNotificationToPanel(event);
 
@@ -1308,6 +1333,15 @@ function handle_backend_event(event) {
             showToast("Data Updated", `New data available for ${event.payload.symbol}`, "info");
         }
     }
+    else if (event.type === 'REFRESH_DONE') {
+        const result = event.result || {};
+        if (result.ok === false) {
+            showToast("Refresh Skipped", result.message || "Collector did not save new data.", "info");
+        } else {
+            showToast("Refresh Complete", result.message || "Latest market data saved.", "info");
+            loadSymbol();
+        }
+    }
     else if (event.type === 'magnet_change') {
         const p = event.payload;
         // Check if irrelevant to current view? Maybe show anyway if it's important.